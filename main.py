@@ -1,9 +1,15 @@
 from __future__ import annotations
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from public_api import router as public_router
+from public_api import router as public_router, close_client, openapi_components, prewarm, MsgspecResponse
+import asyncio
+import os
+import sys
 
-app = FastAPI(title="Public Market Data API (no-pandas)", version="0.1.0")
+# 本服務直接解析 Yahoo JSON，不應載入 pandas / yfinance
+assert "yfinance" not in sys.modules and "pandas" not in sys.modules, "pandas/yfinance must not be imported"
+
+app = FastAPI(title="Public Market Data API (no-pandas)", version="0.1.0", default_response_class=MsgspecResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -17,8 +23,33 @@ app.add_middleware(
 def health():
     return {"ok": True}
 
+@app.on_event("startup")
+async def startup():
+    # 設定 PREWARM=1 才在背景預抓 COMMON 清單，預設不在啟動時大量請求 Yahoo
+    if os.environ.get("PREWARM") == "1":
+        app.state.prewarm_task = asyncio.create_task(prewarm())
+
+@app.on_event("shutdown")
+async def shutdown():
+    await close_client()
+
 app.include_router(public_router)
 
+_base_openapi = app.openapi
+
+def openapi():
+    # 併入 public_api 以 msgspec 產生的回應 schema
+    if app.openapi_schema is None:
+        schema = _base_openapi()
+        schema.setdefault("components", {}).setdefault("schemas", {}).update(openapi_components)
+    return app.openapi_schema
+
+app.openapi = openapi
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # 開發時以 RELOAD=1 啟用自動重載（只能單一 worker）；
+    # 正式環境預設每顆 CPU 一個 worker，可用 WEB_CONCURRENCY 覆寫
+    reload = os.environ.get("RELOAD") == "1"
+    workers = 1 if reload else int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=reload, workers=workers, loop="uvloop", http="httptools")
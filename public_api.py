@@ -1,15 +1,115 @@
 from __future__ import annotations
-from fastapi import APIRouter, Query, HTTPException
-from pydantic import BaseModel
-from typing import Optional, List
+from fastapi import APIRouter, Query, HTTPException, Request
+from fastapi.responses import Response
+from typing import Optional, List, Dict, Literal, Union
 from cachetools import TTLCache
 from datetime import datetime, timezone
+from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+import asyncio
+import functools
+import hashlib
+import io
+import os
+import sqlite3
 import time
-import requests
+import httpx
+import msgspec
+import numpy as np
 
 router = APIRouter(prefix="/api/public", tags=["public-data"])
 cache = TTLCache(maxsize=256, ttl=600)
+# 共用連線池：所有 Yahoo 請求重用 keep-alive / HTTP/2 連線
+_client = httpx.AsyncClient(http2=True, timeout=20, limits=httpx.Limits(max_keepalive_connections=64))
 
+async def close_client():
+    await _client.aclose()
+
+# 回應一律以 msgspec 編碼（C 實作，直接輸出 bytes），不經 pydantic 驗證
+_encoder = msgspec.json.Encoder()
+
+class MsgspecResponse(Response):
+    # main.py 的預設回應類別，端點有無 msgspec.Struct 都用同一個編碼器
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return _encoder.encode(content)
+
+def _json(obj, headers: Optional[Dict[str, str]] = None) -> Response:
+    return MsgspecResponse(obj, headers=headers)
+
+# 歷史資料變動慢：讓瀏覽器/CDN 快取 10 分鐘，過期後一小時內可先用舊資料再背景重新驗證
+_CACHE_CONTROL = "public, max-age=600, stale-while-revalidate=3600"
+
+def _etag(*parts) -> str:
+    # numpy 陣列直接雜湊原始 bytes，其他參數以字串雜湊
+    h = hashlib.blake2b(digest_size=8)
+    for p in parts:
+        h.update(p.tobytes() if isinstance(p, np.ndarray) else str(p).encode())
+        h.update(b"|")
+    return '"' + h.hexdigest() + '"'
+
+def _not_modified(request: Request, etag: str) -> bool:
+    inm = request.headers.get("if-none-match")
+    if not inm:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in inm.split(",")]
+    return "*" in tags or etag in tags
+
+# 已結束年度的日線不會再變動，依 (symbol, year) 存進 SQLite，重啟後仍可沿用。
+# adj_close 會隨之後的除權息回溯調整，所以資料超過 FIN_CACHE_MAX_AGE 秒就重抓。
+_DISK_MAX_AGE = int(os.environ.get("FIN_CACHE_MAX_AGE", "86400"))
+_DISK_PATH = os.environ.get("FIN_CACHE_PATH", "/tmp/fin_cache.sqlite3")
+_disk = sqlite3.connect(_DISK_PATH, check_same_thread=False, isolation_level=None)
+_disk.execute("PRAGMA journal_mode=WAL")
+# 每欄以 npz 存原始陣列（不 pickle 任何 Python 類別），讀取時 allow_pickle=False
+_disk.execute("CREATE TABLE IF NOT EXISTS ohlcv_npz (symbol TEXT, year INTEGER, fetched INTEGER, block BLOB, PRIMARY KEY (symbol, year))")
+
+def _disk_get(sym: str, year: int) -> Optional[OhlcvBlock]:
+    row = _disk.execute("SELECT fetched, block FROM ohlcv_npz WHERE symbol=? AND year=?", (sym, year)).fetchone()
+    if row is None or time.time() - row[0] > _DISK_MAX_AGE:
+        return None
+    try:
+        with np.load(io.BytesIO(row[1]), allow_pickle=False) as z:
+            return OhlcvBlock(*(z[f] for f in _OHLCV_FIELDS))
+    except Exception:
+        # 內容損毀或格式不符時視為未命中，改向 Yahoo 重抓並覆寫
+        return None
+
+def _npz(block: OhlcvBlock) -> bytes:
+    buf = io.BytesIO()
+    np.savez(buf, **{f: getattr(block, f) for f in _OHLCV_FIELDS})
+    return buf.getvalue()
+
+def _disk_put(sym: str, blocks: Dict[int, OhlcvBlock]):
+    # 同一次抓取的各年度在單一交易內寫入
+    if not blocks:
+        return
+    now = int(time.time())
+    with _disk:
+        _disk.execute("BEGIN")
+        _disk.executemany("INSERT OR REPLACE INTO ohlcv_npz VALUES (?, ?, ?, ?)", [(sym, y, now, _npz(b)) for y, b in blocks.items()])
+
+# 同一 key 的快取未命中同時只向 Yahoo 發一次請求，其餘請求等待同一個 task
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+def _inflight_done(key: tuple, task: asyncio.Task):
+    _inflight.pop(key, None)
+    # 等待者可能都已斷線；主動讀取例外，避免 "Task exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+async def _coalesce(key: tuple, factory):
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda t: _inflight_done(key, t))
+    # shield：某個客戶端斷線時不會取消其他人也在等待的抓取
+    return await asyncio.shield(task)
+
+# 純函式、輸入有限，前端輪詢時同一代號只需正規化一次
+@functools.lru_cache(maxsize=4096)
 def _symbol_norm(symbol: str) -> str:
     s = symbol.strip().upper()
     if s.endswith(".TW") or s.endswith(".TWO"):
@@ -18,154 +118,360 @@ def _symbol_norm(symbol: str) -> str:
         return f"{s}.TW"
     return s
 
+# 以 UTC 日序號 (ts // 86400) 快取格式化後的日期，避免每列都呼叫 strftime
+_DATE_CACHE: Dict[int, str] = {}
+
+def _fmt(ts: int) -> str:
+    d = int(ts) // 86400
+    s = _DATE_CACHE.get(d)
+    if s is None:
+        s = datetime.utcfromtimestamp(d * 86400).strftime("%Y-%m-%d")
+        _DATE_CACHE[d] = s
+    return s
+
+def _date_slice(dates: List[str], rows: list, start: str, end: str) -> list:
+    return rows[bisect_left(dates, start):bisect_right(dates, end)]
+
+def _norm_date(d: str) -> str:
+    # strptime 接受 "2018-1-1"，但快取鍵與切片都以字串比較日期，先統一補零成 YYYY-MM-DD
+    try:
+        return datetime.strptime(d, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"Invalid date (expected YYYY-MM-DD): {d}")
+
 def _date_to_unix(d: str) -> int:
     dt = datetime.strptime(d, "%Y-%m-%d").replace(tzinfo=timezone.utc)
     return int(dt.timestamp())
 
-def _yahoo_chart(sym: str, start: str, end: str, interval: str = "1d", include_events=True):
+async def _yahoo_chart(sym: str, start: str, end: str, interval: str = "1d", include_events=True):
     p1 = _date_to_unix(start)
     # Yahoo的period2為「非包含」時刻，往後+86400保證包含end當日
     p2 = _date_to_unix(end) + 86400
     events = "div,splits" if include_events else "none"
     url = f"https://query1.finance.yahoo.com/v8/finance/chart/{sym}?period1={p1}&period2={p2}&interval={interval}&events={events}"
-    r = requests.get(url, timeout=20)
+    r = await _client.get(url)
     if r.status_code != 200:
         raise HTTPException(status_code=502, detail=f"Yahoo chart error: {r.status_code}")
     data = r.json()
     return data
 
-class OHLCVResp(BaseModel):
+# v7 spark 每次最多接受 20 檔，回傳 {"spark":{"result":[{"symbol","response":[chart]}]}}；
+# v8 spark 則是以代號為 key 的物件，格式不同，這裡固定使用 v7
+_SPARK_CHUNK = 20
+
+async def _yahoo_spark(syms: List[str], start: str, end: str, interval: str = "1d"):
+    p1 = _date_to_unix(start)
+    p2 = _date_to_unix(end) + 86400
+    url = f"https://query1.finance.yahoo.com/v7/finance/spark?symbols={','.join(syms)}&period1={p1}&period2={p2}&interval={interval}"
+    r = await _client.get(url)
+    if r.status_code != 200:
+        raise HTTPException(status_code=502, detail=f"Yahoo spark error: {r.status_code}")
+    data = r.json()
+    return data
+
+class OHLCVResp(msgspec.Struct):
     date: str
-    open: float
-    high: float
-    low: float
-    close: float
+    # spark 只回傳收盤價，其餘欄位可能為 null
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: Optional[float] = None
     adj_close: Optional[float] = None
     volume: Optional[float] = None
 
-@router.get("/ohlcv", response_model=List[OHLCVResp])
-def get_ohlcv(
+_OHLCV_FIELDS = ("date", "open", "high", "low", "close", "adj_close", "volume")
+
+class ColumnarOHLCVResp(msgspec.Struct):
+    date: List[str]
+    open: List[Optional[float]]
+    high: List[Optional[float]]
+    low: List[Optional[float]]
+    close: List[Optional[float]]
+    adj_close: List[Optional[float]]
+    volume: List[Optional[float]]
+
+def _pad(xs, n: int) -> list:
+    # Yahoo 偶爾缺欄位或長度不足，補 None 使各欄與 timestamp 對齊
+    if not xs:
+        return [None] * n
+    if len(xs) < n:
+        return list(xs) + [None] * (n - len(xs))
+    return xs
+
+@dataclass
+class OhlcvBlock:
+    # 以欄為單位 (SoA) 存放日線：日期為 U10 字串陣列，其餘為 float64，缺值以 NaN 表示
+    date: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    adj_close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.date)
+
+    def __getitem__(self, sl: slice) -> "OhlcvBlock":
+        # 切片只建立 view，不複製資料
+        return OhlcvBlock(*(getattr(self, f)[sl] for f in _OHLCV_FIELDS))
+
+    @classmethod
+    def build(cls, dates, *cols) -> "OhlcvBlock":
+        return cls(np.asarray(dates, dtype="U10"), *(np.asarray(c, dtype=np.float64) for c in cols))
+
+    @classmethod
+    def concat(cls, blocks: List["OhlcvBlock"]) -> "OhlcvBlock":
+        if not blocks:
+            return _EMPTY_BLOCK
+        return cls(*(np.concatenate([getattr(b, f) for b in blocks]) for f in _OHLCV_FIELDS))
+
+    def between(self, start: str, end: str) -> "OhlcvBlock":
+        return self[np.searchsorted(self.date, start, "left"):np.searchsorted(self.date, end, "right")]
+
+    def columns(self) -> ColumnarOHLCVResp:
+        return ColumnarOHLCVResp(*(getattr(self, f).tolist() for f in _OHLCV_FIELDS))
+
+    def rows(self) -> List[OHLCVResp]:
+        return [OHLCVResp(*t) for t in zip(*(getattr(self, f).tolist() for f in _OHLCV_FIELDS))]
+
+_EMPTY_BLOCK = OhlcvBlock.build([], [], [], [], [], [], [])
+
+def _ohlcv_block(r0: dict) -> OhlcvBlock:
+    ts = r0.get("timestamp", []) or []
+    ind = r0.get("indicators", {})
+    quote = (ind.get("quote") or [{}])[0]
+    adj = (ind.get("adjclose") or [{}])[0]
+    n = len(ts)
+    return OhlcvBlock.build(
+        [_fmt(t) for t in ts],
+        _pad(quote.get("open"), n),
+        _pad(quote.get("high"), n),
+        _pad(quote.get("low"), n),
+        _pad(quote.get("close"), n),
+        _pad(adj.get("adjclose"), n),
+        _pad(quote.get("volume"), n),
+    )
+
+# 與 yfinance period="max" 相同的下限；KO、IBM 可回溯到 1962，^GSPC 到 1927
+_FIRST_YEAR = 1900
+
+async def _ohlcv_history(sym: str, start: str, end: str) -> OhlcvBlock:
+    # 過去年度優先讀 SQLite，缺的年度與今年合併成一次 Yahoo 請求；
+    # 早於 _FIRST_YEAR 的 start 不必逐年查詢或寫入空年度
+    this_year = datetime.utcnow().year
+    y0, y1 = max(int(start[:4]), _FIRST_YEAR), int(end[:4])
+    closed = range(y0, min(y1, this_year - 1) + 1)
+    by_year = {}
+    for y in closed:
+        block = _disk_get(sym, y)
+        if block is not None:
+            by_year[y] = block
+    missing = [y for y in closed if y not in by_year]
+    if missing or y1 >= this_year:
+        f0 = f"{missing[0]:04d}-01-01" if missing else f"{this_year:04d}-01-01"
+        f1 = end if y1 >= this_year else f"{missing[-1]:04d}-12-31"
+        data = await _yahoo_chart(sym, f0, f1, "1d", include_events=False)
+        res = data.get("chart", {}).get("result", [])
+        fetched = _ohlcv_block(res[0]) if res else _EMPTY_BLOCK
+        if len(fetched):
+            parts = {y: fetched.between(f"{y:04d}-01-01", f"{y:04d}-12-31") for y in range(int(f0[:4]), int(f1[:4]) + 1)}
+            _disk_put(sym, {y: parts[y] for y in missing})
+            for y, part in parts.items():
+                by_year.setdefault(y, part)
+    return OhlcvBlock.concat([by_year[y] for y in sorted(by_year)]).between(start, end)
+
+async def _ohlcv_cached(sym: str, start: str, end: str) -> OhlcvBlock:
+    key = ("ohlcv_np", sym, start, end)
+    block = cache.get(key)
+    if block is None:
+        block = await _coalesce(key, lambda: _load_ohlcv(key, sym, start, end))
+    return block
+
+async def _load_ohlcv(key: tuple, sym: str, start: str, end: str) -> OhlcvBlock:
+    block = await _ohlcv_history(sym, start, end)
+    if len(block):
+        cache[key] = block
+    return block
+
+class DividendResp(msgspec.Struct):
+    date: str
+    cash: float
+
+class SplitResp(msgspec.Struct):
+    date: str
+    ratio: float
+
+class InfoResp(msgspec.Struct):
+    symbol: str
+    longName: str | None = None
+    currency: str | None = None
+    exchange: str | None = None
+    marketCap: float | None = None
+    sector: str | None = None
+    industry: str | None = None
+
+# 回應模型改用 msgspec.Struct，FastAPI 無法自動產生其 schema；
+# 這裡以 msgspec 產生 JSON Schema，再由 main.py 併入 OpenAPI components
+_DOC_TYPES = [
+    Union[List[OHLCVResp], ColumnarOHLCVResp],
+    Dict[str, List[OHLCVResp]],
+    List[DividendResp],
+    List[SplitResp],
+    InfoResp,
+]
+_doc_schemas, openapi_components = msgspec.json.schema_components(_DOC_TYPES, ref_template="#/components/schemas/{name}")
+_DOCS = {tp: {200: {"description": "Successful Response", "content": {"application/json": {"schema": sc}}}} for tp, sc in zip(_DOC_TYPES, _doc_schemas)}
+
+@router.get("/ohlcv", response_model=None, responses=_DOCS[Union[List[OHLCVResp], ColumnarOHLCVResp]])
+async def get_ohlcv(
+    request: Request,
     symbol: str = Query(...),
     start: str = Query("2018-01-01"),
     end: str = Query(datetime.utcnow().strftime("%Y-%m-%d")),
     limit: int = Query(5000, ge=1, le=20000),
     offset: int = Query(0, ge=0),
+    format: Literal["records", "columnar"] = Query("records", description="columnar 以欄為單位回傳，每個欄位名稱只出現一次"),
 ):
     sym = _symbol_norm(symbol)
-    key = ("ohlcv_np", sym, start, end)
-    rows = cache.get(key)
-    if rows is None:
-        data = _yahoo_chart(sym, start, end, "1d", include_events=False)
-        res = data.get("chart", {}).get("result", [])
-        if not res:
-            return []
-        r0 = res[0]
-        ts = r0.get("timestamp", []) or []
-        ind = r0.get("indicators", {})
-        quote = (ind.get("quote") or [{}])[0]
-        adj = (ind.get("adjclose") or [{}])[0]
-        opens = quote.get("open", [])
-        highs = quote.get("high", [])
-        lows = quote.get("low", [])
-        closes = quote.get("close", [])
-        vols = quote.get("volume", [])
-        adjs = adj.get("adjclose", [])
-
-        rows = []
-        for i, t in enumerate(ts):
-            d = datetime.utcfromtimestamp(t).strftime("%Y-%m-%d")
-            rows.append({
-                "date": d,
-                "open": None if opens is None or i>=len(opens) else opens[i],
-                "high": None if highs is None or i>=len(highs) else highs[i],
-                "low":  None if lows  is None or i>=len(lows)  else lows[i],
-                "close":None if closes is None or i>=len(closes) else closes[i],
-                "adj_close": None if adjs is None or i>=len(adjs) else adjs[i],
-                "volume": None if vols is None or i>=len(vols) else vols[i],
-            })
-        cache[key] = rows
-
-    total = len(rows)
+    start, end = _norm_date(start), _norm_date(end)
+    block = await _ohlcv_cached(sym, start, end)
+    total = len(block)
     lo = min(offset, total)
     hi = min(offset + limit, total)
-    return rows[lo:hi]
+    # ETag 涵蓋查詢參數與本頁每個欄位的內容（含還原權值重算）；內容未變時回 304，不必序列化也不傳送內容
+    view = block[lo:hi]
+    etag = _etag(sym, start, end, lo, hi, format, total, *(getattr(view, f) for f in _OHLCV_FIELDS))
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    if format == "columnar":
+        return _json(view.columns(), headers)
+    return _json(view.rows(), headers)
 
-class DividendResp(BaseModel):
-    date: str
-    cash: float
+# batch 對每檔各發一個 Yahoo 請求，限制檔數以免單一請求放大成數百個上游請求
+_BATCH_MAX = 50
+
+@router.get("/ohlcv/batch", response_model=None, responses=_DOCS[Dict[str, List[OHLCVResp]]])
+async def get_ohlcv_batch(
+    symbols: str = Query(..., description="以逗號分隔，如 SPY,QQQ,2330；最多 50 檔"),
+    start: str = Query("2018-01-01"),
+    end: str = Query(datetime.utcnow().strftime("%Y-%m-%d")),
+):
+    # 多檔同時向 Yahoo 發出請求，總延遲約等於最慢的一檔
+    syms = list(dict.fromkeys(_symbol_norm(s) for s in symbols.split(",") if s.strip()))
+    if len(syms) > _BATCH_MAX:
+        raise HTTPException(status_code=422, detail=f"Too many symbols: {len(syms)} > {_BATCH_MAX}")
+    start, end = _norm_date(start), _norm_date(end)
+    results = await asyncio.gather(*[_ohlcv_cached(s, start, end) for s in syms])
+    return _json({s: b.rows() for s, b in zip(syms, results)})
+
+def _parse_spark(data: dict) -> Dict[str, OhlcvBlock]:
+    out = {}
+    for item in (data.get("spark", {}) or {}).get("result", []) or []:
+        resp = item.get("response") or []
+        out[item["symbol"]] = _ohlcv_block(resp[0]) if resp else _EMPTY_BLOCK
+    return out
+
+async def _spark_chunk(syms: List[str], start: str, end: str) -> Dict[str, OhlcvBlock]:
+    out = _parse_spark(await _yahoo_spark(syms, start, end))
+    for sym, block in out.items():
+        if len(block):
+            cache[("spark_np", sym, start, end)] = block
+    return out
 
-@router.get("/dividends", response_model=List[DividendResp])
-def get_dividends(
+@router.get("/ohlcv/multi", response_model=None, responses=_DOCS[Dict[str, List[OHLCVResp]]])
+async def get_ohlcv_multi(
+    symbols: str = Query(..., description="以逗號分隔，如 SPY,QQQ,2330"),
+    start: str = Query("2018-01-01"),
+    end: str = Query(datetime.utcnow().strftime("%Y-%m-%d")),
+):
+    # 每 20 檔合併成一個 spark 請求；已有快取的代號直接略過。
+    # 只讀 spark_np 快取：spark 只有收盤價，混用 ohlcv_np 會讓回應欄位隨快取狀態而變
+    syms = list(dict.fromkeys(_symbol_norm(s) for s in symbols.split(",") if s.strip()))
+    start, end = _norm_date(start), _norm_date(end)
+    found = {}
+    for s in syms:
+        block = cache.get(("spark_np", s, start, end))
+        if block is not None:
+            found[s] = block
+    missing = [s for s in syms if s not in found]
+    chunks = [missing[i:i + _SPARK_CHUNK] for i in range(0, len(missing), _SPARK_CHUNK)]
+    for part in await asyncio.gather(*[_spark_chunk(c, start, end) for c in chunks]):
+        found.update(part)
+    return _json({s: found[s].rows() if s in found else [] for s in syms})
+
+# 常見比例只有少數幾種 ("2/1"、"3/2"...)，解析結果快取起來
+_RATIO_CACHE: Dict[str, float] = {}
+
+def _split_ratio(ratio_str: str) -> float:
+    # Yahoo給 "splitRatio": "4/1" 形式
+    r = _RATIO_CACHE.get(ratio_str)
+    if r is None:
+        try:
+            a, b = ratio_str.split("/")
+            r = float(a) / float(b)
+        except Exception:
+            r = 1.0
+        _RATIO_CACHE[ratio_str] = r
+    return r
+
+async def _events_cached(sym: str) -> dict:
+    # 一次抓取完整的除權息歷史（月線資料量小），依日期排序後快取；
+    # 之後任何日期區間都只需二分搜尋切片，不必再向 Yahoo 請求
+    key = ("events_np", sym)
+    ev = cache.get(key)
+    if ev is None:
+        ev = await _coalesce(key, lambda: _load_events(key, sym))
+    return ev
+
+async def _load_events(key: tuple, sym: str) -> dict:
+    data = await _yahoo_chart(sym, f"{_FIRST_YEAR:04d}-01-01", datetime.utcnow().strftime("%Y-%m-%d"), "1mo", include_events=True)
+    res = data.get("chart", {}).get("result", [])
+    if not res:
+        return {"dividends": ([], []), "splits": ([], [])}
+    events = res[0].get("events", {}) or {}
+    divs = []
+    for v in sorted((events.get("dividends") or {}).values(), key=lambda v: int(v["date"])):
+        divs.append(DividendResp(_fmt(v["date"]), float(v.get("amount", 0))))
+    splits = []
+    for v in sorted((events.get("splits") or {}).values(), key=lambda v: int(v["date"])):
+        splits.append(SplitResp(_fmt(v["date"]), _split_ratio(v.get("splitRatio", "1/1"))))
+    ev = {
+        "dividends": ([r.date for r in divs], divs),
+        "splits": ([r.date for r in splits], splits),
+    }
+    cache[key] = ev
+    return ev
+
+@router.get("/dividends", response_model=None, responses=_DOCS[List[DividendResp]])
+async def get_dividends(
     symbol: str = Query(...),
     start: str = Query("2018-01-01"),
     end: str = Query(datetime.utcnow().strftime("%Y-%m-%d")),
 ):
     sym = _symbol_norm(symbol)
-    key = ("div_np", sym, start, end)
-    rows = cache.get(key)
-    if rows is None:
-        data = _yahoo_chart(sym, start, end, "1d", include_events=True)
-        res = data.get("chart", {}).get("result", [])
-        if not res:
-            return []
-        events = res[0].get("events", {})
-        divs = events.get("dividends", {})
-        rows = []
-        for _, v in sorted(divs.items(), key=lambda kv: int(kv[1]["date"])):
-            dt = datetime.utcfromtimestamp(v["date"]).strftime("%Y-%m-%d")
-            rows.append({"date": dt, "cash": float(v.get("amount", 0))})
-        cache[key] = rows
-    return rows
-
-class SplitResp(BaseModel):
-    date: str
-    ratio: float
+    start, end = _norm_date(start), _norm_date(end)
+    dates, rows = (await _events_cached(sym))["dividends"]
+    return _json(_date_slice(dates, rows, start, end))
 
-@router.get("/splits", response_model=List[SplitResp])
-def get_splits(
+@router.get("/splits", response_model=None, responses=_DOCS[List[SplitResp]])
+async def get_splits(
     symbol: str = Query(...),
     start: str = Query("2010-01-01"),
     end: str = Query(datetime.utcnow().strftime("%Y-%m-%d")),
 ):
     sym = _symbol_norm(symbol)
-    key = ("split_np", sym, start, end)
-    rows = cache.get(key)
-    if rows is None:
-        data = _yahoo_chart(sym, start, end, "1d", include_events=True)
-        res = data.get("chart", {}).get("result", [])
-        if not res:
-            return []
-        events = res[0].get("events", {})
-        splits = events.get("splits", {})
-        rows = []
-        for _, v in sorted(splits.items(), key=lambda kv: int(kv[1]["date"])):
-            dt = datetime.utcfromtimestamp(v["date"]).strftime("%Y-%m-%d")
-            # Yahoo給 "splitRatio": "4/1" 形式
-            ratio_str = v.get("splitRatio", "1/1")
-            try:
-                a, b = ratio_str.split("/")
-                ratio = float(a) / float(b)
-            except Exception:
-                ratio = 1.0
-            rows.append({"date": dt, "ratio": ratio})
-        cache[key] = rows
-    return rows
-
-class InfoResp(BaseModel):
-    symbol: str
-    longName: str | None = None
-    currency: str | None = None
-    exchange: str | None = None
-    marketCap: float | None = None
-    sector: str | None = None
-    industry: str | None = None
+    start, end = _norm_date(start), _norm_date(end)
+    dates, rows = (await _events_cached(sym))["splits"]
+    return _json(_date_slice(dates, rows, start, end))
 
-@router.get("/info", response_model=InfoResp)
-def get_info(symbol: str = Query(...)):
+@router.get("/info", response_model=None, responses=_DOCS[InfoResp])
+async def get_info(symbol: str = Query(...)):
     # 以 Yahoo quoteSummary 取簡要資訊
     sym = _symbol_norm(symbol)
     url = f"https://query1.finance.yahoo.com/v10/finance/quoteSummary/{sym}?modules=price,assetProfile"
-    r = requests.get(url, timeout=20)
+    r = await _client.get(url)
     if r.status_code != 200:
         raise HTTPException(status_code=502, detail=f"Yahoo info error: {r.status_code}")
     js = r.json()
@@ -173,7 +479,7 @@ def get_info(symbol: str = Query(...)):
     price = (result[0].get("price") if result else {}) or {}
     profile = (result[0].get("assetProfile") if result else {}) or {}
 
-    return InfoResp(
+    return _json(InfoResp(
         symbol=sym,
         longName=(price.get("longName") or price.get("shortName")),
         currency=price.get("currency"),
@@ -181,13 +487,47 @@ def get_info(symbol: str = Query(...)):
         marketCap=(price.get("marketCap") or {}).get("raw"),
         sector=profile.get("sector"),
         industry=profile.get("industry"),
-    )
+    ))
 
 COMMON = {
     "ETF_TW": ["0050.TW","0056.TW","00878.TW","00919.TW"],
     "ETF_US": ["SPY","VOO","VTI","VYM","SCHD","QQQ"]
 }
 
+_prewarm_fd: Optional[int] = None
+
+def _prewarm_lock() -> bool:
+    # 多個 worker 時只有搶到檔案鎖的 process 預抓；flock 隨 process 結束自動釋放，
+    # 不會像 O_EXCL 鎖檔一樣在當機後殘留
+    global _prewarm_fd
+    try:
+        import fcntl
+    except ImportError:
+        return True
+    fd = os.open(_DISK_PATH + ".prewarm.lock", os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    _prewarm_fd = fd
+    return True
+
+async def prewarm():
+    # 啟動時並行抓取常用清單的日線（與 /ohlcv 預設區間相同），
+    # 填入記憶體快取與 SQLite；單一代號失敗不影響其他代號
+    if not _prewarm_lock():
+        return
+    end = datetime.utcnow().strftime("%Y-%m-%d")
+    syms = [s for group in COMMON.values() for s in group]
+    await asyncio.gather(*[_ohlcv_cached(s, "2018-01-01", end) for s in syms], return_exceptions=True)
+
+# 清單固定不變，啟動時先編碼成 JSON bytes，請求時直接回傳
+_UNIVERSE_CACHE = {k: _encoder.encode({"market": k, "symbols": v}) for k, v in COMMON.items()}
+
 @router.get("/universe")
-def get_universe(market: str = Query("ETF_TW")):
-    return {"market": market, "symbols": COMMON.get(market.upper(), [])}
+async def get_universe(market: str = Query("ETF_TW")):
+    body = _UNIVERSE_CACHE.get(market.upper())
+    if body is None:
+        raise HTTPException(status_code=404, detail=f"Unknown market: {market}")
+    return Response(content=body, media_type="application/json")
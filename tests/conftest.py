@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# public_api 於 import 時開啟 SQLite，測試改用暫存檔
+os.environ.setdefault("FIN_CACHE_PATH", os.path.join(tempfile.mkdtemp(), "fin_cache.sqlite3"))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
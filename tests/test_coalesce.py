@@ -0,0 +1,43 @@
+import asyncio
+import gc
+
+import public_api
+
+
+def test_coalesce_shares_one_call():
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(*[public_api._coalesce(("t", "share"), factory) for _ in range(5)])
+
+    assert asyncio.run(run()) == ["ok"] * 5
+    assert calls == [1]
+    assert ("t", "share") not in public_api._inflight
+
+
+def test_coalesce_failure_after_waiter_disconnects_is_retrieved():
+    errors = []
+
+    async def factory():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("upstream 502")
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _loop, ctx: errors.append(ctx))
+        waiter = asyncio.ensure_future(public_api._coalesce(("t", "fail"), factory))
+        await asyncio.sleep(0.005)
+        waiter.cancel()
+        await asyncio.sleep(0.05)
+        gc.collect()
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    gc.collect()
+    assert not [e for e in errors if "never retrieved" in e.get("message", "")]
+    assert ("t", "fail") not in public_api._inflight
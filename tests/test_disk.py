@@ -0,0 +1,37 @@
+import math
+
+import public_api
+
+
+def _block():
+    return public_api.OhlcvBlock.build(
+        ["2023-01-03", "2023-01-04"],
+        [1.0, None], [2.0, 2.5], [0.5, 0.6], [1.5, 1.6], [1.4, 1.5], [100, 200],
+    )
+
+
+def test_disk_roundtrip():
+    public_api._disk_put("TEST.RT", {2023: _block()})
+    got = public_api._disk_get("TEST.RT", 2023)
+    assert got.date.tolist() == ["2023-01-03", "2023-01-04"]
+    assert got.open[0] == 1.0 and math.isnan(got.open[1])
+    assert got.volume.tolist() == [100.0, 200.0]
+
+
+def test_disk_roundtrip_empty_year():
+    public_api._disk_put("TEST.EMPTY", {2001: public_api._EMPTY_BLOCK})
+    assert len(public_api._disk_get("TEST.EMPTY", 2001)) == 0
+
+
+def test_disk_corrupt_blob_is_a_miss():
+    public_api._disk.execute(
+        "INSERT OR REPLACE INTO ohlcv_npz VALUES (?, ?, ?, ?)", ("TEST.BAD", 2020, 2**40, b"not an npz")
+    )
+    assert public_api._disk_get("TEST.BAD", 2020) is None
+
+
+def test_disk_put_writes_all_years_atomically():
+    public_api._disk_put("TEST.TX", {2020: _block(), 2021: _block()})
+    assert not public_api._disk.in_transaction
+    n = public_api._disk.execute("SELECT COUNT(*) FROM ohlcv_npz WHERE symbol=?", ("TEST.TX",)).fetchone()[0]
+    assert n == 2
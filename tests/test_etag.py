@@ -0,0 +1,25 @@
+import public_api
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def test_etag_changes_when_adj_close_is_restated():
+    app = FastAPI()
+    app.include_router(public_api.router)
+    client = TestClient(app)
+    key = ("ohlcv_np", "TEST.ETAG", "2024-01-01", "2024-01-31")
+    dates = ["2024-01-02", "2024-01-03"]
+    ohlc = [[1.0, 1.0], [2.0, 2.0], [0.5, 0.5], [1.5, 1.5]]
+    params = {"symbol": "TEST.ETAG", "start": "2024-01-01", "end": "2024-01-31"}
+
+    public_api.cache[key] = public_api.OhlcvBlock.build(dates, *ohlc, [1.4, 1.4], [100, 100])
+    r = client.get("/api/public/ohlcv", params=params)
+    etag = r.headers["etag"]
+    assert client.get("/api/public/ohlcv", params=params, headers={"If-None-Match": etag}).status_code == 304
+
+    # 只有歷史還原價改變，最後一根K棒的收盤價相同
+    public_api.cache[key] = public_api.OhlcvBlock.build(dates, *ohlc, [1.3, 1.4], [100, 100])
+    r = client.get("/api/public/ohlcv", params=params, headers={"If-None-Match": etag})
+    assert r.status_code == 200
+    assert r.headers["etag"] != etag
+    assert r.json()[0]["adj_close"] == 1.3
@@ -0,0 +1,28 @@
+import public_api
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def test_dividends_before_1970_and_unpadded_dates(monkeypatch):
+    calls = []
+
+    async def fake_chart(sym, start, end, interval="1d", include_events=True):
+        calls.append(start)
+        # 1962-03-01 與 1962-06-01
+        return {"chart": {"result": [{"events": {"dividends": {
+            "b": {"date": -247312800, "amount": 0.2},
+            "a": {"date": -239364000, "amount": 0.25},
+        }}}]}}
+
+    monkeypatch.setattr(public_api, "_yahoo_chart", fake_chart)
+    app = FastAPI()
+    app.include_router(public_api.router)
+    client = TestClient(app)
+
+    r = client.get("/api/public/dividends", params={"symbol": "TEST.DIV", "start": "1962-1-1", "end": "1962-3-1"})
+    assert r.status_code == 200
+    assert calls == ["1900-01-01"]
+    assert r.json() == [{"date": "1962-03-01", "cash": 0.2}]
+
+    r = client.get("/api/public/dividends", params={"symbol": "TEST.DIV", "start": "1962-13-01"})
+    assert r.status_code == 422
@@ -0,0 +1,90 @@
+import asyncio
+
+import public_api
+
+
+def _chart(timestamps):
+    n = len(timestamps)
+    return {"chart": {"result": [{
+        "timestamp": timestamps,
+        "indicators": {"quote": [{"open": [1.0] * n, "high": [2.0] * n, "low": [0.5] * n,
+                                  "close": [1.5] * n, "volume": [100] * n}],
+                       "adjclose": [{"adjclose": [1.4] * n}]},
+    }]}}
+
+
+def test_pre_1970_history_is_kept(monkeypatch):
+    calls = []
+
+    async def fake_chart(sym, start, end, interval="1d", include_events=True):
+        calls.append((start, end))
+        # 1962-01-02 與 1962-01-03
+        return _chart([-252324000, -252237600])
+
+    monkeypatch.setattr(public_api, "_yahoo_chart", fake_chart)
+    block = asyncio.run(public_api._ohlcv_history("TEST.KO", "1962-01-01", "1962-12-31"))
+
+    assert calls == [("1962-01-01", "1962-12-31")]
+    assert block.date.tolist() == ["1962-01-02", "1962-01-03"]
+    assert public_api._disk_get("TEST.KO", 1962).date.tolist() == ["1962-01-02", "1962-01-03"]
+
+
+def test_early_start_is_clamped_to_1900(monkeypatch):
+    calls = []
+
+    async def fake_chart(sym, start, end, interval="1d", include_events=True):
+        calls.append((start, end))
+        # 1900-01-02
+        return _chart([-2208852000])
+
+    monkeypatch.setattr(public_api, "_yahoo_chart", fake_chart)
+    block = asyncio.run(public_api._ohlcv_history("TEST.EARLY", "0001-01-01", "1901-12-31"))
+
+    assert calls == [("1900-01-01", "1901-12-31")]
+    assert block.date.tolist() == ["1900-01-02"]
+    years = [y for (y,) in public_api._disk.execute(
+        "SELECT year FROM ohlcv_npz WHERE symbol=? ORDER BY year", ("TEST.EARLY",))]
+    assert years == [1900, 1901]
+
+
+def test_unpadded_dates_are_normalised(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    calls = []
+
+    async def fake_chart(sym, start, end, interval="1d", include_events=True):
+        calls.append((start, end))
+        # 2000-01-03 與 2000-01-04
+        return _chart([946893600, 946980000])
+
+    monkeypatch.setattr(public_api, "_yahoo_chart", fake_chart)
+    app = FastAPI()
+    app.include_router(public_api.router)
+    client = TestClient(app)
+
+    r = client.get("/api/public/ohlcv", params={"symbol": "TEST.PAD", "start": "2000-1-1", "end": "2000-1-4"})
+    assert r.status_code == 200
+    assert [row["date"] for row in r.json()] == ["2000-01-03", "2000-01-04"]
+    assert calls[0][0] == "2000-01-01"
+    # 補零後與標準寫法共用同一個快取鍵
+    r = client.get("/api/public/ohlcv", params={"symbol": "TEST.PAD", "start": "2000-01-01", "end": "2000-01-04"})
+    assert len(r.json()) == 2 and len(calls) == 1
+
+    r = client.get("/api/public/ohlcv", params={"symbol": "TEST.PAD", "start": "2000/01/01"})
+    assert r.status_code == 422
+
+
+def test_batch_rejects_too_many_symbols(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    async def fake_chart(*args, **kwargs):
+        raise AssertionError("should not reach Yahoo")
+
+    monkeypatch.setattr(public_api, "_yahoo_chart", fake_chart)
+    app = FastAPI()
+    app.include_router(public_api.router)
+    syms = ",".join(f"T{i}" for i in range(public_api._BATCH_MAX + 1))
+    r = TestClient(app).get("/api/public/ohlcv/batch", params={"symbols": syms})
+    assert r.status_code == 422
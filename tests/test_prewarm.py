@@ -0,0 +1,17 @@
+import os
+import subprocess
+import sys
+
+import public_api
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_prewarm_lock_is_exclusive_across_processes():
+    assert public_api._prewarm_lock()
+    # 另一個 worker process 拿不到同一把鎖
+    code = "import conftest, public_api; print(public_api._prewarm_lock())"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=HERE, env=os.environ.copy(), capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"
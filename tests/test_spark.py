@@ -0,0 +1,65 @@
+import json
+import math
+import os
+
+import public_api
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "spark_v7.json")
+
+
+def _load():
+    with open(FIXTURE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_parse_spark_v7_result():
+    blocks = public_api._parse_spark(_load())
+    assert sorted(blocks) == ["2330.TW", "NOPE", "SPY"]
+
+    spy = blocks["SPY"]
+    assert spy.date.tolist() == ["2024-01-02", "2024-01-03", "2024-01-04", "2024-01-05"]
+    assert spy.close[0] == 472.6499938964844
+    assert math.isnan(spy.close[-1])
+    assert spy.adj_close[0] == 459.7200012207031
+    # spark 只有收盤價
+    assert all(math.isnan(x) for x in spy.open)
+
+    tw = blocks["2330.TW"]
+    assert tw.date.tolist() == ["2024-01-02", "2024-01-03", "2024-01-04"]
+    assert tw.close.tolist() == [593.0, 586.0, 581.0]
+    assert all(math.isnan(x) for x in tw.adj_close)
+
+    assert len(blocks["NOPE"]) == 0
+
+
+def test_parse_spark_rows_encode_nan_as_null():
+    rows = public_api._parse_spark(_load())["SPY"].rows()
+    out = json.loads(public_api._encoder.encode(rows))
+    assert out[0]["date"] == "2024-01-02"
+    assert out[0]["open"] is None
+    assert out[-1]["close"] is None
+
+
+def test_parse_spark_empty_or_error():
+    assert public_api._parse_spark({}) == {}
+    assert public_api._parse_spark({"spark": {"result": None, "error": {"code": "Bad Request"}}}) == {}
+
+
+def test_multi_ignores_full_ohlcv_cache(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    async def fake_spark(syms, start, end, interval="1d"):
+        return _load()
+
+    monkeypatch.setattr(public_api, "_yahoo_spark", fake_spark)
+    # 先放一筆完整 OHLC 的快取，multi 仍應回傳只有收盤價的 spark 形狀
+    public_api.cache[("ohlcv_np", "SPY", "2024-01-01", "2024-01-05")] = public_api.OhlcvBlock.build(
+        ["2024-01-02"], [1.0], [2.0], [0.5], [1.5], [1.4], [100])
+    app = FastAPI()
+    app.include_router(public_api.router)
+    r = TestClient(app).get("/api/public/ohlcv/multi",
+                            params={"symbols": "SPY,2330.TW", "start": "2024-01-01", "end": "2024-01-05"})
+    out = r.json()
+    assert len(out["SPY"]) == 4 and len(out["2330.TW"]) == 3
+    assert all(row["open"] is None for rows in out.values() for row in rows)